@@ -1,53 +1,623 @@
 # app.py
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
 from flask_cors import CORS
-import subprocess
+import numpy as np
+import orjson
+import ctypes
 import json
 import tempfile
+import hashlib
+import fnmatch
+import shutil
 import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import gevent
+    import gevent.monkey
+except ImportError:
+    gevent = None
 
 app = Flask(__name__)
 CORS(app)
 
-# C++ executable wrapper
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+LIBRARY_SOURCE = os.path.join(BACKEND_DIR, 'satopt.cpp')
+LIBRARY_PATH = os.path.join(BACKEND_DIR, 'libsatopt.so')
+LIBRARY_FLAGS = ['-std=c++17', '-O3', '-march=native', '-fopenmp', '-shared', '-fPIC']
+
+# Toolchain resolved once at import; spawn() needs absolute program paths
+GXX = shutil.which('g++')
+CCACHE = shutil.which('ccache')
+
+# Subprocess fallback: compiled programs are kept here, one directory per
+# process, keyed by source digest
+app.config.setdefault('SATOPT_BUILD_DIR', os.path.join(BACKEND_DIR, 'build'))
+app.config.setdefault('CCACHE_DIR', os.environ.get('CCACHE_DIR', '/var/cache/satopt_ccache'))
+EXECUTABLE_CACHE_SIZE = 256
+
+# Catalog served by /api/satellites; id order is insertion order, which the
+# greedy uses to break ties the same way as the in-memory optimizers
+app.config.setdefault('SATOPT_CATALOG', os.path.join(BACKEND_DIR, 'catalog.db'))
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS satellites (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    cost REAL NOT NULL,
+    region TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS sat_index USING rtree_i32(id, start_minute, end_minute);
+"""
+
+# Same constellation as main.cpp, used by /api/default-optimization
+DEFAULT_SATELLITES = [
+    {'name': 'Sat-Alpha', 'start': 0, 'end': 6, 'cost': 1200, 'region': 'Asia'},
+    {'name': 'Sat-Beta', 'start': 4, 'end': 10, 'cost': 1500, 'region': 'Europe'},
+    {'name': 'Sat-Gamma', 'start': 8, 'end': 14, 'cost': 1800, 'region': 'Asia'},
+    {'name': 'Sat-Delta', 'start': 12, 'end': 18, 'cost': 1300, 'region': 'Americas'},
+    {'name': 'Sat-Epsilon', 'start': 16, 'end': 22, 'cost': 1600, 'region': 'Europe'},
+    {'name': 'Sat-Zeta', 'start': 20, 'end': 24, 'cost': 1100, 'region': 'Global'},
+    {'name': 'Sat-Eta', 'start': 2, 'end': 8, 'cost': 900, 'region': 'Asia'},
+    {'name': 'Sat-Theta', 'start': 10, 'end': 16, 'cost': 1400, 'region': 'Europe'},
+    {'name': 'Sat-Iota', 'start': 14, 'end': 20, 'cost': 1700, 'region': 'Americas'},
+    {'name': 'Sat-Kappa', 'start': 18, 'end': 23, 'cost': 1000, 'region': 'Global'},
+]
+
+# Region id understood by libsatopt as "no filter"
+ALL_REGIONS = -1
+
+# Fields of the columnar all_satellites response
+SATELLITE_COLUMNS = ('name', 'start', 'end', 'duration', 'cost', 'region')
+
+# Patterns for the text printed by the generated subprocess program
+SATELLITE_ROW_RE = re.compile(
+    r'^(\S+)\s+(-?[\d.]+)\s+(-?[\d.]+)\s+(-?[\d.]+)\s+(-?[\d.]+)\s+(\S+)[ \t]*$', re.M)
+MINIMUM_RE = re.compile(
+    r'Selected Satellites: \d+\n(?P<selected>.*)\n'
+    r'Coverage Gaps: \d+\n(?P<gaps>.*)')
+# One "start-end" token per gap, e.g. "5.00-7.00"
+GAP_RE = re.compile(r'(-?[\d.]+)-(-?[\d.]+)')
+SUMMARY_RE = re.compile(r'^(Total Duration|Covered Duration|Coverage Percentage|Satellites Used|Total Cost): (\S+)',
+                        re.M)
+SUMMARY_KEYS = {
+    'Total Duration': 'total_duration',
+    'Covered Duration': 'covered_duration',
+    'Coverage Percentage': 'coverage_percentage',
+    'Satellites Used': 'satellites_used',
+    'Total Cost': 'total_cost',
+}
+
+# Encoded responses remembered by /api/optimize, keyed by payload digest.
+# Capped by total body size: one large constellation can encode to megabytes
+RESULT_CACHE_BYTES = 64 * 2 ** 20
+
+# Optimizers work on whole minutes; the API speaks hours
+MINUTES_PER_HOUR = 60
+# Largest accepted |time| in minutes; half the int32 range, so the
+# difference of two times still fits in int32
+MAX_MINUTES = 2 ** 30
+
+# Below this many satellites the NumPy sweep is cheaper than a library call
+NUMPY_CUTOFF = 2000
+
+class Job(ctypes.Structure):
+    """Mirror of ``struct Job`` in satopt.cpp."""
+    _fields_ = [
+        ('starts', ctypes.POINTER(ctypes.c_int32)),
+        ('ends', ctypes.POINTER(ctypes.c_int32)),
+        ('costs', ctypes.POINTER(ctypes.c_double)),
+        ('region_ids', ctypes.POINTER(ctypes.c_int)),
+        ('n', ctypes.c_int),
+        ('region', ctypes.c_int),
+        ('t0', ctypes.c_int32),
+        ('t1', ctypes.c_int32),
+    ]
+
+class Result(ctypes.Structure):
+    """Mirror of ``struct Result`` in satopt.cpp."""
+    _fields_ = [
+        ('nsel', ctypes.c_int),
+        ('sel_idx', ctypes.POINTER(ctypes.c_int)),
+        ('ngaps', ctypes.c_int),
+        ('gaps', ctypes.POINTER(ctypes.c_double)),
+        ('total_dur', ctypes.c_double),
+        ('covered_dur', ctypes.c_double),
+        ('pct', ctypes.c_double),
+        ('total_cost', ctypes.c_double),
+    ]
+
+def load_library():
+    """Compile libsatopt.so if it is missing or older than satopt.cpp, then load it.
+
+    The compile happens at most once per source change instead of once per
+    request. It writes to a temporary name that is renamed over LIBRARY_PATH,
+    so a concurrent or interrupted build never leaves a truncated library
+    for another process to load. Returns None when the library cannot be
+    built or loaded, in which case requests run on the NumPy/Numba kernels.
+    """
+    try:
+        if (not os.path.exists(LIBRARY_PATH) or
+                os.path.getmtime(LIBRARY_PATH) < os.path.getmtime(LIBRARY_SOURCE)):
+            fd, partial_path = tempfile.mkstemp(prefix='libsatopt.', suffix='.so',
+                                                dir=BACKEND_DIR)
+            os.close(fd)
+            try:
+                returncode, _, stderr = spawn([GXX or 'g++', *LIBRARY_FLAGS, LIBRARY_SOURCE,
+                                               '-o', partial_path])
+                if returncode != 0:
+                    raise OSError(f"g++ exited with status {returncode}: {stderr}")
+                os.replace(partial_path, LIBRARY_PATH)
+            finally:
+                if os.path.exists(partial_path):
+                    os.unlink(partial_path)
+        lib = ctypes.CDLL(LIBRARY_PATH)
+    except OSError as e:
+        app.logger.warning("libsatopt unavailable, using NumPy kernels: %s", e)
+        return None
+
+    lib.optimize.argtypes = [ctypes.POINTER(Job), ctypes.POINTER(Result)]
+    lib.optimize.restype = None
+    lib.optimize_batch.argtypes = [ctypes.POINTER(Job), ctypes.c_int, ctypes.POINTER(Result)]
+    lib.optimize_batch.restype = None
+    return lib
+
+def spawn(argv, input=None, env=None):
+    """Run ``argv`` via os.posix_spawn and return ``(returncode, stdout, stderr)``.
+
+    subprocess forks when gevent has patched it (its posix_spawn path is
+    disabled there), and a fork copies the page tables of the whole worker.
+    The child's stdin/stdout/stderr are temporary files, so there are no
+    pipes to pump while waiting.
+    """
+    with tempfile.TemporaryFile() as stdin, tempfile.TemporaryFile() as stdout, \
+            tempfile.TemporaryFile() as stderr:
+        if input is not None:
+            stdin.write(input.encode())
+            stdin.seek(0)
+        pid = os.posix_spawn(argv[0], argv, os.environ if env is None else env, file_actions=[
+            (os.POSIX_SPAWN_DUP2, stdin.fileno(), 0),
+            (os.POSIX_SPAWN_DUP2, stdout.fileno(), 1),
+            (os.POSIX_SPAWN_DUP2, stderr.fileno(), 2),
+        ])
+        returncode = wait_child(pid)
+        stdout.seek(0)
+        stderr.seek(0)
+        return (returncode, stdout.read().decode(errors='replace'),
+                stderr.read().decode(errors='replace'))
+
+def wait_child(pid):
+    """Exit code of a spawned child.
+
+    Under gevent workers the hub reaps children from its SIGCHLD handler and
+    drops the status of any it is not watching. The child watcher is
+    registered before this greenlet yields, so it gets the status and other
+    greenlets keep serving meanwhile.
+    """
+    if gevent is not None and gevent.monkey.is_module_patched('os'):
+        hub = gevent.get_hub()
+        with hub.loop.child(pid, False) as watcher:
+            hub.wait(watcher)
+        status = watcher.rstatus
+    else:
+        _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+# Files an older, shared build directory could have left directly under root
+BUILD_LEFTOVERS = ('satopt_*', 'tmp*.cpp')
+
+def sweep_build_dirs(root):
+    """Delete build directories under ``root`` left by processes that have exited.
+
+    Only pid-named directories and BUILD_LEFTOVERS are touched; anything else
+    in a configured SATOPT_BUILD_DIR is not ours to remove.
+    """
+    if not os.path.isdir(root):
+        return
+    for entry in os.listdir(root):
+        path = os.path.join(root, entry)
+        if entry.isdigit():
+            if os.path.isdir(path) and not process_alive(int(entry)):
+                shutil.rmtree(path, ignore_errors=True)
+        elif any(fnmatch.fnmatch(entry, pattern) for pattern in BUILD_LEFTOVERS):
+            if os.path.isfile(path):
+                os.unlink(path)
+
+def process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def as_pointer(array, ctype):
+    return array.ctypes.data_as(ctypes.POINTER(ctype))
+
+def to_minutes(hours):
+    """Round hour values to whole minutes as int32.
+
+    Raises ValueError for NaN, infinities and values beyond MAX_MINUTES,
+    which the int32 cast would otherwise wrap silently.
+    """
+    minutes = np.rint(np.asarray(hours, dtype=np.float64) * MINUTES_PER_HOUR)
+    # NaN fails the comparison too
+    if not np.all(np.abs(minutes) <= MAX_MINUTES):
+        raise ValueError(f"times must be finite and within ±{MAX_MINUTES // MINUTES_PER_HOUR} hours")
+    return minutes.astype(np.int32)
+
+def pack_satellites(satellites_data, region='All'):
+    """Pack satellite dicts into contiguous arrays and intern the region labels.
+
+    Returns ``(starts, ends, costs, region_ids, target_region)`` with start and
+    end times in minutes; an unknown filter region gets an id that no satellite
+    carries, so it matches nothing.
+    """
+    starts = to_minutes([sat['start'] for sat in satellites_data])
+    ends = to_minutes([sat['end'] for sat in satellites_data])
+    costs = np.ascontiguousarray([sat['cost'] for sat in satellites_data], dtype=np.float64)
+    
+    region_table = {}
+    region_ids = np.ascontiguousarray(
+        [region_table.setdefault(sat['region'], len(region_table)) for sat in satellites_data],
+        dtype=np.intc)
+    target_region = ALL_REGIONS if region == 'All' else region_table.get(region, len(region_table))
+    return starts, ends, costs, region_ids, target_region
+
+def format_result(satellites_data, starts, ends, costs, selected, gaps, summary):
+    """Build the API response from optimizer output.
+
+    ``all_satellites`` is columnar: one list per field, indexed by satellite.
+    The numeric columns stay NumPy arrays; json_response serializes them
+    directly.
+
+    ``starts``/``ends`` are in minutes, ``selected`` holds indices into
+    ``satellites_data``, ``gaps`` is a (k, 2) array of start/end hours and
+    ``summary`` is ``(total_duration, covered_duration, coverage_percentage,
+    total_cost)``.
+    """
+    names = [sat['name'] for sat in satellites_data]
+    total_duration, covered_duration, coverage_percentage, total_cost = summary
+    return {
+        'all_satellites': {
+            'name': names,
+            'start': starts / MINUTES_PER_HOUR,
+            'end': ends / MINUTES_PER_HOUR,
+            'duration': (ends - starts) / MINUTES_PER_HOUR,
+            'cost': costs,
+            'region': [sat['region'] for sat in satellites_data]
+        },
+        'min_satellites': {
+            'selected': [names[i] for i in selected.tolist()],
+            'gaps': [{'start': start, 'end': end} for start, end in gaps.tolist()]
+        },
+        'summary': {
+            'total_duration': total_duration,
+            'covered_duration': covered_duration,
+            'coverage_percentage': coverage_percentage,
+            'satellites_used': len(selected),
+            'total_cost': total_cost
+        }
+    }
+
+class LibraryCall:
+    """Job/Result pair for one constellation plus the numpy buffers they point into.
+
+    The buffers must stay referenced until the library call has returned, so
+    they live on this object alongside the structs.
+    """
+    def __init__(self, satellites_data, region='All', target_start=0.0, target_end=24.0):
+        n = len(satellites_data)
+        self.satellites_data = satellites_data
+        self.starts, self.ends, self.costs, self.region_ids, target_region = \
+            pack_satellites(satellites_data, region)
+        
+        self.selected = np.empty(n, dtype=np.intc)
+        self.gaps = np.empty((n + 1, 2), dtype=np.float64)
+        self.job = Job(starts=as_pointer(self.starts, ctypes.c_int32),
+                       ends=as_pointer(self.ends, ctypes.c_int32),
+                       costs=as_pointer(self.costs, ctypes.c_double),
+                       region_ids=as_pointer(self.region_ids, ctypes.c_int),
+                       n=n, region=target_region,
+                       t0=int(to_minutes(target_start)), t1=int(to_minutes(target_end)))
+        self.out = Result(sel_idx=as_pointer(self.selected, ctypes.c_int),
+                          gaps=as_pointer(self.gaps, ctypes.c_double))
+    
+    def to_dict(self, out=None):
+        out = self.out if out is None else out
+        return format_result(self.satellites_data, self.starts, self.ends, self.costs,
+                             self.selected[:out.nsel], self.gaps[:out.ngaps],
+                             (out.total_dur, out.covered_dur, out.pct, out.total_cost))
+
+def greedy_numpy(starts, ends, costs, region_ids, target_start, target_end, target_region):
+    """NumPy port of findMinimumSatellites + getCoverageSummary from satopt.cpp.
+
+    For small constellations this beats the fixed cost of a library call. The
+    candidate window for each step is found with searchsorted and the best
+    extender with argmax, so Python only loops once per selected satellite.
+    Times are in minutes. Returns ``(selected, gaps, summary)`` in the shape
+    format_result expects.
+    """
+    if target_region == ALL_REGIONS:
+        candidates = np.arange(len(starts))
+    else:
+        candidates = np.flatnonzero(region_ids == target_region)
+    order = candidates[np.argsort(starts[candidates], kind='stable')]
+    s = starts[order]
+    e = ends[order]
+    
+    selected = []
+    gaps = []
+    covered_minutes = 0
+    current_end = target_start
+    n = len(order)
+    i = 0
+    while current_end < target_end and i < n:
+        # Satellites i..window-1 start at or before the current position
+        window = max(i, int(np.searchsorted(s, current_end, side='right')))
+        if window > i:
+            best = i + int(np.argmax(e[i:window]))
+            i = window
+            if e[best] > current_end:
+                selected.append(best)
+                covered_minutes += int(min(target_end, e[best]) - current_end)
+                current_end = e[best]
+                continue
+        
+        # Gap detected
+        if i >= n:
+            break
+        gap_end = min(target_end, s[i])
+        if current_end < gap_end:
+            gaps.append((current_end, gap_end))
+        selected.append(i)
+        covered_minutes += max(0, int(min(target_end, e[i]) - s[i]))
+        current_end = e[i]
+        i += 1
+    
+    if current_end < target_end:
+        gaps.append((current_end, target_end))
+    
+    selected = order[np.asarray(selected, dtype=np.intp)]
+    gaps = np.array(gaps, dtype=np.float64).reshape(-1, 2) / MINUTES_PER_HOUR
+    return selected, gaps, summarize(costs, selected, covered_minutes, target_start, target_end)
+
+def summarize(costs, selected, covered_minutes, target_start, target_end):
+    """Coverage summary tuple (durations in hours) for the satellites at ``selected``.
+
+    Times are in minutes. ``covered_minutes`` is the union of the selected
+    intervals inside the window, as tallied by the greedy sweep; summing their
+    durations instead would count every overlap twice.
+    """
+    total_minutes = target_end - target_start
+    return (total_minutes / MINUTES_PER_HOUR, covered_minutes / MINUTES_PER_HOUR,
+            covered_minutes / total_minutes * 100.0, float(costs[selected].sum()))
+
+if numba is not None:
+    @numba.njit(cache=True, boundscheck=False)
+    def greedy_cover(starts, ends, region_ids, order, target_id, t0, t1, out_sel, out_gaps):
+        """Fused region filter + greedy sweep over the presorted ``order``.
+
+        Same selection rules as findMinimumSatellites in satopt.cpp. Writes
+        selected indices into out_sel and gap pairs (minutes) into out_gaps, and returns
+        how many of each were written along with the covered minutes.
+        """
+        n = order.shape[0]
+        nsel = 0
+        ngaps = 0
+        covered = 0
+        current_end = t0
+        k = 0
+        while current_end < t1:
+            # Scan satellites of the target region that can cover current_end
+            best_end = current_end
+            best = -1
+            while k < n:
+                j = order[k]
+                if target_id != ALL_REGIONS and region_ids[j] != target_id:
+                    k += 1
+                    continue
+                if starts[j] > current_end:
+                    break
+                if ends[j] > best_end:
+                    best_end = ends[j]
+                    best = j
+                k += 1
+            
+            if best >= 0:
+                out_sel[nsel] = best
+                nsel += 1
+                covered += min(t1, best_end) - current_end
+                current_end = best_end
+                continue
+            
+            # Gap detected; k is the next satellite of the region, if any
+            if k >= n:
+                break
+            j = order[k]
+            gap_end = min(t1, starts[j])
+            if current_end < gap_end:
+                out_gaps[ngaps, 0] = current_end
+                out_gaps[ngaps, 1] = gap_end
+                ngaps += 1
+            out_sel[nsel] = j
+            nsel += 1
+            covered += max(0, min(t1, ends[j]) - starts[j])
+            current_end = ends[j]
+            k += 1
+        
+        if current_end < t1:
+            out_gaps[ngaps, 0] = current_end
+            out_gaps[ngaps, 1] = t1
+            ngaps += 1
+        return nsel, ngaps, covered
+
+# C++ optimizer wrapper
 class SatelliteOptimizer:
     def __init__(self):
-        self.executable_path = "./satellite_optimizer"
+        self.lib = load_library()
+        # digest of generated source -> compiled program, oldest first
+        self.executables = OrderedDict()
+        # run_subprocess compiles its program on first use; probe for the
+        # compiler once rather than letting each call fail inside spawn()
+        self.have_exe = GXX is not None and os.access(GXX, os.X_OK)
+        if not self.have_exe:
+            app.logger.warning("g++ not found, run_subprocess disabled")
         
-    def run_optimization(self, satellites_data=None):
+    def run_optimization(self, satellites_data=None, region='All'):
+        if satellites_data is None:
+            satellites_data = DEFAULT_SATELLITES
         try:
-            # If no custom data provided, use default
-            if satellites_data is None:
-                result = subprocess.run([self.executable_path], 
-                                      capture_output=True, text=True)
-                return self.parse_output(result.stdout)
-            
-            # Create temporary C++ file with custom data
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=False) as f:
-                f.write(self.generate_cpp_code(satellites_data))
-                temp_file = f.name
-            
-            # Compile and run
-            executable_name = temp_file.replace('.cpp', '')
-            compile_result = subprocess.run([
-                'g++', '-std=c++17', temp_file, '-o', executable_name
-            ], capture_output=True, text=True)
-            
-            if compile_result.returncode != 0:
-                return {"error": "Compilation failed", "details": compile_result.stderr}
-            
-            run_result = subprocess.run([executable_name], capture_output=True, text=True)
-            
-            # Cleanup
-            os.unlink(temp_file)
-            os.unlink(executable_name)
+            # Without libsatopt the in-process kernels take every size; the
+            # compile-and-run program is far slower than either, so
+            # run_subprocess is never chosen here
+            if len(satellites_data) < NUMPY_CUTOFF or self.lib is None:
+                if numba is not None:
+                    return self.run_jit(satellites_data, region)
+                return self.run_numpy(satellites_data, region)
+            return self.run_library(satellites_data, region)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def run_numpy(self, satellites_data, region='All', target_start=0.0, target_end=24.0):
+        starts, ends, costs, region_ids, target_region = pack_satellites(satellites_data, region)
+        t0, t1 = to_minutes([target_start, target_end]).tolist()
+        selected, gaps, summary = greedy_numpy(starts, ends, costs, region_ids,
+                                               t0, t1, target_region)
+        return format_result(satellites_data, starts, ends, costs, selected, gaps, summary)
+    
+    def run_jit(self, satellites_data, region='All', target_start=0.0, target_end=24.0):
+        starts, ends, costs, region_ids, target_region = pack_satellites(satellites_data, region)
+        t0, t1 = to_minutes([target_start, target_end]).tolist()
+        order = np.argsort(starts, kind='stable')
+        selected = np.empty(len(satellites_data), dtype=np.intp)
+        gaps = np.empty((len(satellites_data) + 1, 2), dtype=np.int32)
+        nsel, ngaps, covered = greedy_cover(starts, ends, region_ids, order, target_region,
+                                            t0, t1, selected, gaps)
+        selected = selected[:nsel]
+        summary = summarize(costs, selected, covered, t0, t1)
+        return format_result(satellites_data, starts, ends, costs, selected,
+                             gaps[:ngaps] / MINUTES_PER_HOUR, summary)
+    
+    def run_library(self, satellites_data, region='All'):
+        call = LibraryCall(satellites_data, region)
+        self.lib.optimize(ctypes.byref(call.job), ctypes.byref(call.out))
+        return call.to_dict()
+    
+    def run_batch(self, jobs):
+        """Run several ``{"satellites": [...], "region": ...}`` jobs in one library call."""
+        if self.lib is None:
+            return [self.run_optimization(job.get('satellites', []), job.get('region', 'All'))
+                    for job in jobs]
+        try:
+            calls = [LibraryCall(job.get('satellites', []), job.get('region', 'All')) for job in jobs]
+            job_array = (Job * len(calls))(*[call.job for call in calls])
+            out_array = (Result * len(calls))(*[call.out for call in calls])
+            self.lib.optimize_batch(job_array, len(calls), out_array)
+            return [call.to_dict(out) for call, out in zip(calls, out_array)]
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def run_subprocess(self, satellites_data, region='All'):
+        if not self.have_exe:
+            return {"error": "g++ not found"}
+        try:
+            executable_name, errors = self.build_executable(self.generate_cpp_code())
+            if executable_name is None:
+                return {"error": "Compilation failed", "details": errors}
             
-            return self.parse_output(run_result.stdout)
+            _, stdout, _ = spawn([executable_name, region],
+                                 input=self.encode_satellites(satellites_data))
+            return self.parse_output(stdout)
             
         except Exception as e:
             return {"error": str(e)}
     
-    def generate_cpp_code(self, satellites_data):
+    def build_executable(self, source):
+        """Return ``(path, None)`` for a compiled program, or ``(None, stderr)``.
+
+        Programs live in build_dir() under the blake2b digest of their
+        source and the most recent EXECUTABLE_CACHE_SIZE are remembered, so the
+        compiler only runs again when the source changes. Misses go through
+        ccache when it is installed.
+        """
+        digest = hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+        if digest in self.executables:
+            if os.path.exists(self.executables[digest]):
+                self.executables.move_to_end(digest)
+                return self.executables[digest], None
+            del self.executables[digest]
+        
+        build_dir = self.build_dir()
+        executable_name = os.path.join(build_dir, f'satopt_{digest}')
+        if not os.path.exists(executable_name):
+            fd, source_file = tempfile.mkstemp(suffix='.cpp', dir=build_dir)
+            with os.fdopen(fd, 'w') as f:
+                f.write(source)
+            partial_name = source_file[:-len('.cpp')]
+            
+            compiler = [CCACHE, GXX] if CCACHE else [GXX]
+            returncode, _, stderr = spawn([
+                *compiler, '-std=c++17', '-O2', '-pipe', source_file, '-o', partial_name
+            ], env={**os.environ, 'CCACHE_DIR': app.config['CCACHE_DIR']})
+            os.unlink(source_file)
+            
+            if returncode != 0:
+                return None, stderr
+            # Rename into place so concurrent requests never run a half-written file
+            os.replace(partial_name, executable_name)
+        
+        self.executables[digest] = executable_name
+        if len(self.executables) > EXECUTABLE_CACHE_SIZE:
+            _, stale = self.executables.popitem(last=False)
+            if os.path.exists(stale):
+                os.unlink(stale)
+        return executable_name, None
+    
+    def build_dir(self):
+        """This process's directory under SATOPT_BUILD_DIR, created on first use.
+
+        gunicorn workers each get their own, so one worker's eviction never
+        deletes a program another worker still has cached. Creating it also
+        sweeps the directories of processes that have exited.
+        """
+        root = app.config['SATOPT_BUILD_DIR']
+        build_dir = os.path.join(root, str(os.getpid()))
+        if not os.path.isdir(build_dir):
+            sweep_build_dirs(root)
+            os.makedirs(build_dir, exist_ok=True)
+        return build_dir
+    
+    def encode_satellites(self, satellites_data):
+        """stdin for the fallback program: name, region and "start end cost" lines per satellite."""
+        # Rounded to whole minutes like the in-process paths, so the program
+        # sees exactly the same intervals (and invalid times never reach it)
+        starts = (to_minutes([sat['start'] for sat in satellites_data]) / MINUTES_PER_HOUR).tolist()
+        ends = (to_minutes([sat['end'] for sat in satellites_data]) / MINUTES_PER_HOUR).tolist()
+        lines = []
+        for sat, start, end in zip(satellites_data, starts, ends):
+            name, region = str(sat['name']), str(sat['region'])
+            if '\n' in name or '\n' in region:
+                raise ValueError(f"{name!r}: names and regions cannot contain line breaks")
+            lines += [name, region, f"{start!r} {end!r} {float(sat['cost'])!r}"]
+        return ''.join(line + '\n' for line in lines)
+    
+    def generate_cpp_code(self):
+        """Source of the fallback program.
+
+        Request data never reaches the compiler: the program reads the
+        satellites from stdin (see encode_satellites) and the target region
+        from argv[1], so the source is the same for every payload.
+        """
         base_code = """
 #include <iostream>
 #include <vector>
@@ -146,49 +716,46 @@ public:
     std::pair<std::vector<Satellite>, std::vector<CoverageInterval>>
     findMinimumSatellites(const std::string& region = "All") {
         std::vector<Satellite> filtered = filterByRegion(region);
-        std::sort(filtered.begin(), filtered.end());
+        std::stable_sort(filtered.begin(), filtered.end());
         std::vector<Satellite> selected;
         std::vector<CoverageInterval> gaps;
         double currentEnd = targetStart;
         size_t i = 0;
 
         while (currentEnd < targetEnd && i < filtered.size()) {
-            std::vector<Satellite> candidates;
-
-            // Collect all satellites that can cover current position
+            // Scan the satellites that can cover the current position, keeping
+            // the one that reaches furthest
+            double bestEnd = currentEnd;
+            int bestIdx = -1;
             while (i < filtered.size() &&
                    filtered[i].getInterval().getStart() <= currentEnd) {
-                candidates.push_back(filtered[i]);
+                if (filtered[i].getInterval().getEnd() > bestEnd) {
+                    bestEnd = filtered[i].getInterval().getEnd();
+                    bestIdx = static_cast<int>(i);
+                }
                 i++;
             }
 
-            if (candidates.empty()) {
+            if (bestIdx < 0) {
+                // Nothing left to extend with; the trailing gap is added below
+                if (i >= filtered.size()) {
+                    break;
+                }
+
                 // Gap detected
                 double gapStart = currentEnd;
-                double gapEnd = (i < filtered.size()) ? 
-                    std::min(filtered[i].getInterval().getStart(), targetEnd) : targetEnd;
+                double gapEnd = std::min(targetEnd, filtered[i].getInterval().getStart());
 
                 if (gapStart < gapEnd) {
                     gaps.emplace_back(gapStart, gapEnd);
                 }
 
-                if (i < filtered.size()) {
-                    currentEnd = filtered[i].getInterval().getEnd();
-                    selected.push_back(filtered[i]);
-                    i++;
-                } else {
-                    break;
-                }
+                currentEnd = filtered[i].getInterval().getEnd();
+                selected.push_back(filtered[i]);
+                i++;
             } else {
-                // Select satellite with maximum end time
-                auto bestCandidate = std::max_element(
-                    candidates.begin(), candidates.end(),
-                    [](const Satellite& a, const Satellite& b) {
-                        return a.getInterval().getEnd() < b.getInterval().getEnd();
-                    }
-                );
-                selected.push_back(*bestCandidate);
-                currentEnd = bestCandidate->getInterval().getEnd();
+                selected.push_back(filtered[bestIdx]);
+                currentEnd = bestEnd;
             }
         }
 
@@ -209,12 +776,23 @@ public:
         summary.gaps = gaps;
         summary.totalCost = 0;
 
-        double coveredTime = 0;
+        // Merge the clamped intervals so overlapping satellites count once
+        std::vector<std::pair<double, double>> spans;
         for (const auto& sat : selected) {
             summary.totalCost += sat.getCost();
-            double start = std::max(targetStart, sat.getInterval().getStart());
-            double end = std::min(targetEnd, sat.getInterval().getEnd());
-            coveredTime += (end - start);
+            spans.emplace_back(std::max(targetStart, sat.getInterval().getStart()),
+                               std::min(targetEnd, sat.getInterval().getEnd()));
+        }
+        std::sort(spans.begin(), spans.end());
+
+        double coveredTime = 0;
+        double reached = targetStart;
+        for (const auto& [start, end] : spans) {
+            // Spans entirely outside the target window clamp to start >= end
+            if (start < end && end > reached) {
+                coveredTime += end - std::max(start, reached);
+                reached = end;
+            }
         }
 
         summary.coveredDuration = coveredTime;
@@ -247,20 +825,23 @@ public:
     }
 };
 
-int main() {
+int main(int argc, char* argv[]) {
+    const std::string region = argc > 1 ? argv[1] : "All";
     SatelliteCoverageOptimizer optimizer(0, 24);
-    """
-        
-        # Add satellite data
-        satellite_code = ""
-        for sat in satellites_data:
-            satellite_code += f'    optimizer.addSatellite("{sat["name"]}", {sat["start"]}, {sat["end"]}, {sat["cost"]}, "{sat["region"]}");\n'
-        
-        end_code = """
+
+    // Three lines per satellite: name, region, "start end cost"
+    std::string name, satRegion;
+    double start, end, cost;
+    while (std::getline(std::cin, name) && std::getline(std::cin, satRegion) &&
+           std::cin >> start >> end >> cost) {
+        std::cin.ignore(std::numeric_limits<std::streamsize>::max(), '\\n');
+        optimizer.addSatellite(name, start, end, cost, satRegion);
+    }
+
     // Run analysis
     optimizer.printAllSatellites();
     
-    auto [minSats, minGaps] = optimizer.findMinimumSatellites("All");
+    auto [minSats, minGaps] = optimizer.findMinimumSatellites(region);
     
     std::cout << "=== MINIMUM SATELLITES RESULT ===" << std::endl;
     std::cout << "Selected Satellites: " << minSats.size() << std::endl;
@@ -275,7 +856,7 @@ int main() {
     }
     std::cout << std::endl;
     
-    CoverageSummary summary = optimizer.getCoverageSummary("All");
+    CoverageSummary summary = optimizer.getCoverageSummary(region);
     std::cout << "=== SUMMARY ===" << std::endl;
     std::cout << "Total Duration: " << summary.totalDuration << std::endl;
     std::cout << "Covered Duration: " << summary.coveredDuration << std::endl;
@@ -287,91 +868,291 @@ int main() {
 }
         """
         
-        return base_code + satellite_code + end_code
+        return base_code
     
     def parse_output(self, output):
-        lines = output.split('\n')
         result = {
-            'all_satellites': [],
+            'all_satellites': {column: [] for column in SATELLITE_COLUMNS},
             'min_satellites': {'selected': [], 'gaps': []},
             'summary': {}
         }
         
-        current_section = None
+        # "=== TITLE ===" banners split the output into title/body pairs
+        parts = output.split('===')
+        sections = dict(zip((title.strip() for title in parts[1::2]), parts[2::2]))
         
-        for line in lines:
-            if '=== ALL REGISTERED SATELLITES ===' in line:
-                current_section = 'all_satellites'
-                continue
-            elif '=== MINIMUM SATELLITES RESULT ===' in line:
-                current_section = 'min_satellites'
-                continue
-            elif '=== SUMMARY ===' in line:
-                current_section = 'summary'
-                continue
-            
-            if current_section == 'all_satellites' and '---' not in line and line.strip():
-                parts = line.split()
-                if len(parts) >= 6:
-                    result['all_satellites'].append({
-                        'name': parts[0],
-                        'start': float(parts[1]),
-                        'end': float(parts[2]),
-                        'duration': float(parts[3]),
-                        'cost': float(parts[4]),
-                        'region': parts[5]
-                    })
+        rows = SATELLITE_ROW_RE.findall(sections.get('ALL REGISTERED SATELLITES', ''))
+        if rows:
+            names, starts, ends, durations, costs, regions = zip(*rows)
+            numbers = np.array([starts, ends, durations, costs], dtype=np.float64).tolist()
+            result['all_satellites'] = dict(zip(SATELLITE_COLUMNS, [list(names), *numbers, list(regions)]))
+        
+        minimum = MINIMUM_RE.search(sections.get('MINIMUM SATELLITES RESULT', ''))
+        if minimum:
+            result['min_satellites']['selected'] = minimum.group('selected').split()
+            result['min_satellites']['gaps'] = [
+                {'start': float(start), 'end': float(end)}
+                for start, end in GAP_RE.findall(minimum.group('gaps'))
+            ]
+        
+        for label, value in SUMMARY_RE.findall(sections.get('SUMMARY', '')):
+            key = SUMMARY_KEYS[label]
+            result['summary'][key] = int(value) if key == 'satellites_used' else float(value)
+        
+        return result
+
+# Long-lived satellite catalog
+class SatelliteCatalog:
+    """Satellites kept in SQLite with an R*Tree index over their coverage minutes.
+
+    Constellations are added once through /api/satellites and optimized many
+    times. Each greedy step is a single index query for the best extender (or
+    the next satellite after a gap), so an optimization costs O(k log n) for k
+    selected satellites instead of re-sorting the whole constellation.
+    """
+    def __init__(self, path):
+        self.path = path
+        with self.connect() as conn:
+            conn.executescript(CATALOG_SCHEMA)
+    
+    @contextmanager
+    def connect(self):
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def list_satellites(self):
+        with self.connect() as conn:
+            return self.fetch_satellites(conn)[1]
+    
+    def fetch_satellites(self, conn):
+        """Return ``(ids, satellites_data)`` for the whole catalog in id order."""
+        rows = conn.execute(
+            'SELECT s.id, s.name, i.start_minute, i.end_minute, s.cost, s.region '
+            'FROM satellites s JOIN sat_index i ON i.id = s.id ORDER BY s.id').fetchall()
+        return [row[0] for row in rows], [{
+            'name': name,
+            'start': start / MINUTES_PER_HOUR,
+            'end': end / MINUTES_PER_HOUR,
+            'cost': cost,
+            'region': region
+        } for _, name, start, end, cost, region in rows]
+    
+    def add_satellites(self, satellites_data):
+        """Insert satellites, replacing any existing entry with the same name."""
+        starts = to_minutes([sat['start'] for sat in satellites_data]).tolist()
+        ends = to_minutes([sat['end'] for sat in satellites_data]).tolist()
+        with self.connect() as conn:
+            for sat, start, end in zip(satellites_data, starts, ends):
+                if end < start:
+                    raise ValueError(f"{sat['name']}: end time is before start time")
+                row = conn.execute('SELECT id FROM satellites WHERE name = ?', (sat['name'],)).fetchone()
+                if row is None:
+                    sat_id = conn.execute('INSERT INTO satellites (name, cost, region) VALUES (?, ?, ?)',
+                                          (sat['name'], sat['cost'], sat['region'])).lastrowid
+                else:
+                    sat_id = row[0]
+                    conn.execute('UPDATE satellites SET cost = ?, region = ? WHERE id = ?',
+                                 (sat['cost'], sat['region'], sat_id))
+                conn.execute('INSERT OR REPLACE INTO sat_index (id, start_minute, end_minute) VALUES (?, ?, ?)',
+                             (sat_id, start, end))
+    
+    def remove_satellites(self, names):
+        """Remove the named satellites; unknown names are ignored."""
+        with self.connect() as conn:
+            for name in names:
+                row = conn.execute('SELECT id FROM satellites WHERE name = ?', (name,)).fetchone()
+                if row is not None:
+                    conn.execute('DELETE FROM sat_index WHERE id = ?', row)
+                    conn.execute('DELETE FROM satellites WHERE id = ?', row)
+    
+    def clear(self):
+        """Remove every satellite from the catalog."""
+        with self.connect() as conn:
+            conn.execute('DELETE FROM sat_index')
+            conn.execute('DELETE FROM satellites')
+    
+    def run_optimization(self, region='All', target_start=0.0, target_end=24.0):
+        """Greedy cover over the catalog; same selection rules as satopt.cpp."""
+        try:
+            t0, t1 = to_minutes([target_start, target_end]).tolist()
+            if region == 'All':
+                region_clause, region_args = '', ()
+            else:
+                region_clause, region_args = ' AND s.region = ?', (region,)
+            best_extender = (
+                'SELECT i.id, i.end_minute FROM sat_index i JOIN satellites s ON s.id = i.id '
+                'WHERE i.start_minute <= ? AND i.end_minute > ?' + region_clause +
+                ' ORDER BY i.end_minute DESC, i.start_minute, i.id LIMIT 1')
+            next_after_gap = (
+                'SELECT i.id, i.start_minute, i.end_minute FROM sat_index i JOIN satellites s ON s.id = i.id '
+                'WHERE i.start_minute > ?' + region_clause +
+                ' ORDER BY i.start_minute, i.id LIMIT 1')
             
-            elif current_section == 'min_satellites':
-                if 'Selected Satellites:' in line:
-                    sats = line.split(':')[1].strip().split()
-                    result['min_satellites']['selected'] = sats
-                elif 'Coverage Gaps:' in line:
-                    gaps_text = line.split(':')[1].strip()
-                    if gaps_text != '0':
-                        gap_parts = gaps_text.split()
-                        for i in range(0, len(gap_parts), 2):
-                            if i+1 < len(gap_parts):
-                                start_end = gap_parts[i].split('-')
-                                if len(start_end) == 2:
-                                    result['min_satellites']['gaps'].append({
-                                        'start': float(start_end[0]),
-                                        'end': float(start_end[1])
-                                    })
+            with self.connect() as conn:
+                ids, satellites_data = self.fetch_satellites(conn)
+                selected_ids = []
+                gaps = []
+                covered = 0
+                current_end = t0
+                while current_end < t1:
+                    row = conn.execute(best_extender, (current_end, current_end, *region_args)).fetchone()
+                    if row is not None:
+                        selected_ids.append(row[0])
+                        covered += min(t1, row[1]) - current_end
+                        current_end = row[1]
+                        continue
+                    
+                    # Gap detected
+                    row = conn.execute(next_after_gap, (current_end, *region_args)).fetchone()
+                    if row is None:
+                        break
+                    gap_end = min(t1, row[1])
+                    if current_end < gap_end:
+                        gaps.append((current_end, gap_end))
+                    selected_ids.append(row[0])
+                    covered += max(0, min(t1, row[2]) - row[1])
+                    current_end = row[2]
+                
+                if current_end < t1:
+                    gaps.append((current_end, t1))
             
-            elif current_section == 'summary':
-                if 'Total Duration:' in line:
-                    result['summary']['total_duration'] = float(line.split(':')[1].strip())
-                elif 'Covered Duration:' in line:
-                    result['summary']['covered_duration'] = float(line.split(':')[1].strip())
-                elif 'Coverage Percentage:' in line:
-                    result['summary']['coverage_percentage'] = float(line.split(':')[1].strip())
-                elif 'Satellites Used:' in line:
-                    result['summary']['satellites_used'] = int(line.split(':')[1].strip())
-                elif 'Total Cost:' in line:
-                    result['summary']['total_cost'] = float(line.split(':')[1].strip())
+            starts, ends, costs, _, _ = pack_satellites(satellites_data)
+            position = {sat_id: i for i, sat_id in enumerate(ids)}
+            selected = np.array([position[sat_id] for sat_id in selected_ids], dtype=np.intp)
+            gaps = np.array(gaps, dtype=np.float64).reshape(-1, 2) / MINUTES_PER_HOUR
+            return format_result(satellites_data, starts, ends, costs, selected, gaps,
+                                 summarize(costs, selected, covered, t0, t1))
         
-        return result
+        except Exception as e:
+            return {"error": str(e)}
+
+# Response cache
+class ResponseCache:
+    """LRU map from a digest of the request payload to the encoded JSON response.
+
+    Dashboards re-send the same constellation on every refresh or filter
+    toggle; a hit skips both the optimizer and JSON encoding. The oldest
+    entries are evicted once the bodies add up to more than ``maxbytes``,
+    and a body larger than that on its own is not cached.
+    """
+    def __init__(self, maxbytes=RESULT_CACHE_BYTES):
+        self.maxbytes = maxbytes
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def key(satellites_data, region):
+        # Satellite order is kept: it decides tie-breaks and the response layout
+        payload = json.dumps({'satellites': satellites_data, 'region': region}, sort_keys=True)
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+    
+    def get(self, key):
+        with self.lock:
+            body = self.entries.get(key)
+            if body is not None:
+                self.entries.move_to_end(key)
+            return body
+    
+    def put(self, key, body):
+        if len(body) > self.maxbytes:
+            return
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self.entries[key] = body
+            self.size += len(body)
+            while self.size > self.maxbytes:
+                _, stale = self.entries.popitem(last=False)
+                self.size -= len(stale)
+
+def json_response(payload):
+    """Encode ``payload`` with orjson; NumPy arrays are written without a tolist() copy."""
+    return Response(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+                    mimetype='application/json')
+
+def cached_optimization(satellites_data, region='All'):
+    """Run (or replay) an optimization and return it as a JSON Response."""
+    key = ResponseCache.key(satellites_data, region)
+    body = response_cache.get(key)
+    if body is None:
+        result = optimizer.run_optimization(satellites_data, region)
+        body = orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
+        if 'error' not in result:
+            response_cache.put(key, body)
+    return Response(body, mimetype='application/json')
 
 optimizer = SatelliteOptimizer()
+response_cache = ResponseCache()
+catalog = SatelliteCatalog(app.config['SATOPT_CATALOG'])
 
 # API Routes
 @app.route('/api/optimize', methods=['POST'])
 def optimize_coverage():
     data = request.json
-    satellites = data.get('satellites', [])
+    region = data.get('region', 'All')
+    
+    # Without an explicit constellation, optimize the stored catalog
+    if 'satellites' not in data:
+        return json_response(catalog.run_optimization(region))
+    
+    return cached_optimization(data['satellites'], region)
+
+@app.route('/api/satellites', methods=['GET'])
+def list_catalog():
+    return json_response({'satellites': catalog.list_satellites()})
+
+@app.route('/api/satellites', methods=['POST'])
+def add_to_catalog():
+    data = request.json
+    satellites = data.get('satellites', []) if isinstance(data, dict) else None
+    if not isinstance(satellites, list) or not all(isinstance(sat, dict) for sat in satellites):
+        return json_response({"error": 'expected {"satellites": [{...}]}'}), 400
+    try:
+        catalog.add_satellites(satellites)
+    # TypeError: a field of the wrong type, e.g. an object as a start time
+    except (KeyError, TypeError, ValueError, sqlite3.Error) as e:
+        return json_response({"error": str(e)}), 400
+    return json_response({'satellites': catalog.list_satellites()})
+
+@app.route('/api/satellites', methods=['DELETE'])
+def remove_from_catalog():
+    # Clearing the catalog has to be asked for explicitly; a missing body or
+    # a misspelled key must not wipe it
+    data = request.get_json(silent=True)
+    if isinstance(data, dict) and data.get('all') is True:
+        catalog.clear()
+    else:
+        names = data.get('names') if isinstance(data, dict) else None
+        if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+            return json_response({"error": 'expected {"names": [...]} or {"all": true}'}), 400
+        catalog.remove_satellites(names)
+    return json_response({'satellites': catalog.list_satellites()})
+
+@app.route('/api/optimize-batch', methods=['POST'])
+def optimize_batch():
+    data = request.json
+    jobs = data.get('jobs', []) if isinstance(data, dict) else None
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        return json_response({"error": 'expected {"jobs": [{"satellites": [...], "region": ...}]}'}), 400
     
-    result = optimizer.run_optimization(satellites)
-    return jsonify(result)
+    results = optimizer.run_batch(jobs)
+    if isinstance(results, dict):
+        return json_response(results)
+    return json_response({'results': results})
 
 @app.route('/api/default-optimization', methods=['GET'])
 def default_optimization():
-    result = optimizer.run_optimization()
-    return jsonify(result)
+    return cached_optimization(DEFAULT_SATELLITES)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    return jsonify({"status": "healthy", "message": "Satellite Coverage Optimizer API is running"})
+    return json_response({"status": "healthy", "message": "Satellite Coverage Optimizer API is running"})
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    app.run(debug=False, port=5000)
\ No newline at end of file
@@ -0,0 +1,11 @@
+# gunicorn.conf.py
+# Run from backend/: gunicorn -c gunicorn.conf.py wsgi:application
+import multiprocessing
+
+bind = '0.0.0.0:5000'
+workers = multiprocessing.cpu_count()
+worker_class = 'gevent'
+
+# Import app.py (and dlopen libsatopt.so) once in the master; workers inherit
+# the loaded library copy-on-write instead of each building/loading it.
+preload_app = True
@@ -0,0 +1,282 @@
+// satopt.cpp
+// Coverage optimizer built once as a shared library and called from app.py
+// through ctypes:
+//   g++ -std=c++17 -O3 -march=native -fopenmp -shared -fPIC satopt.cpp -o libsatopt.so
+#include <vector>
+#include <algorithm>
+#include <limits>
+#include <cmath>
+#include <cstdint>
+#ifdef __AVX2__
+#include <immintrin.h>
+#endif
+
+// Times are whole minutes from the start of the day; hours only appear in
+// the summary figures handed back to Python.
+const double MINUTES_PER_HOUR = 60.0;
+
+// ==================== CoverageInterval Class ====================
+class CoverageInterval {
+private:
+    int32_t start;
+    int32_t end;
+
+public:
+    CoverageInterval(int32_t s, int32_t e) : start(s), end(e) {}
+
+    int32_t getStart() const { return start; }
+    int32_t getEnd() const { return end; }
+    int32_t getDuration() const { return end - start; }
+
+    // Intersection is non-empty; plain integer min/max, no branches
+    bool overlaps(const CoverageInterval& other) const {
+        return std::max(start, other.start) < std::min(end, other.end);
+    }
+
+    bool operator<(const CoverageInterval& other) const {
+        return start < other.start;
+    }
+};
+
+// ==================== Coverage Summary Structure ====================
+struct CoverageSummary {
+    double totalDuration;
+    double coveredDuration;
+    double coveragePercentage;
+    std::vector<CoverageInterval> gaps;
+    int satellitesUsed;
+    double totalCost;
+};
+
+// Region id meaning "do not filter".
+const int ALL_REGIONS = -1;
+
+// Output of findMinimumSatellites(). coveredTime is the union of the selected
+// intervals inside the target window, in minutes, tallied during the sweep.
+struct MinimumCover {
+    std::vector<int> selected;
+    std::vector<CoverageInterval> gaps;
+    int64_t coveredTime;
+};
+
+// ==================== Satellite Coverage Optimizer Class ====================
+// Satellites are stored as parallel arrays (structure of arrays) and referred
+// to by index. Names and region labels stay on the Python side; regions arrive
+// here already interned to small integer ids.
+class SatelliteCoverageOptimizer {
+private:
+    std::vector<int32_t> starts;
+    std::vector<int32_t> ends;
+    std::vector<double> costs;
+    std::vector<int> regionIds;
+    int32_t targetStart;
+    int32_t targetEnd;
+
+    // Indices of the satellites in a region, stable-sorted by start time.
+    // Filtering first means only the region's own satellites get sorted.
+    std::vector<int> filterByRegion(int region) const {
+        const int n = static_cast<int>(starts.size());
+        std::vector<int> filtered(n);
+
+        int count = 0;
+        int i = 0;
+        if (region == ALL_REGIONS) {
+            for (; i < n; i++) {
+                filtered[i] = i;
+            }
+            count = n;
+        }
+#ifdef __AVX2__
+        // Compare 8 region ids per instruction and emit the matching lanes
+        const __m256i target = _mm256_set1_epi32(region);
+        for (; i + 8 <= n; i += 8) {
+            __m256i ids = _mm256_loadu_si256(
+                reinterpret_cast<const __m256i*>(regionIds.data() + i));
+            unsigned mask = _mm256_movemask_ps(
+                _mm256_castsi256_ps(_mm256_cmpeq_epi32(ids, target)));
+            while (mask) {
+                filtered[count++] = i + __builtin_ctz(mask);
+                mask &= mask - 1;
+            }
+        }
+#endif
+        // Branch-free compaction: always write, advance only on a match
+        for (; i < n; i++) {
+            filtered[count] = i;
+            count += regionIds[i] == region;
+        }
+        filtered.resize(count);
+        std::stable_sort(filtered.begin(), filtered.end(),
+                         [this](int a, int b) { return starts[a] < starts[b]; });
+        return filtered;
+    }
+
+public:
+    SatelliteCoverageOptimizer(int32_t start = 0, int32_t end = 24 * 60)
+        : targetStart(start), targetEnd(end) {}
+
+    void reserve(size_t n) {
+        starts.reserve(n);
+        ends.reserve(n);
+        costs.reserve(n);
+        regionIds.reserve(n);
+    }
+
+    void addSatellite(int32_t start, int32_t end, double cost = 1.0, int region = 0) {
+        starts.push_back(start);
+        ends.push_back(end);
+        costs.push_back(cost);
+        regionIds.push_back(region);
+    }
+
+    // Greedy Algorithm: Minimum Number of Satellites
+    MinimumCover findMinimumSatellites(int region = ALL_REGIONS) {
+        std::vector<int> filtered = filterByRegion(region);
+
+        std::vector<int> selected;
+        std::vector<CoverageInterval> gaps;
+        int64_t coveredTime = 0;
+        int32_t currentEnd = targetStart;
+        const size_t n = filtered.size();
+        size_t i = 0;
+
+        while (currentEnd < targetEnd && i < n) {
+            // Scan the satellites that can cover the current position, keeping
+            // the one that reaches furthest
+            int32_t bestEnd = currentEnd;
+            int bestIdx = -1;
+            while (i < n && starts[filtered[i]] <= currentEnd) {
+                if (ends[filtered[i]] > bestEnd) {
+                    bestEnd = ends[filtered[i]];
+                    bestIdx = filtered[i];
+                }
+                i++;
+            }
+
+            if (bestIdx < 0) {
+                // Nothing left to extend with; the trailing gap is added below
+                if (i >= n) {
+                    break;
+                }
+
+                // Gap detected
+                int32_t gapStart = currentEnd;
+                int32_t gapEnd = std::min(targetEnd, starts[filtered[i]]);
+
+                if (gapStart < gapEnd) {
+                    gaps.emplace_back(gapStart, gapEnd);
+                }
+
+                // The new satellite starts past currentEnd, so all of it is
+                // new coverage
+                coveredTime += std::max(0, std::min(targetEnd, ends[filtered[i]]) -
+                                           starts[filtered[i]]);
+                currentEnd = ends[filtered[i]];
+                selected.push_back(filtered[i]);
+                i++;
+            } else {
+                // Only the part beyond currentEnd is new coverage
+                coveredTime += std::min(targetEnd, bestEnd) - currentEnd;
+                selected.push_back(bestIdx);
+                currentEnd = bestEnd;
+            }
+        }
+
+        if (currentEnd < targetEnd) {
+            gaps.emplace_back(currentEnd, targetEnd);
+        }
+
+        return {selected, gaps, coveredTime};
+    }
+
+    // Get comprehensive coverage summary
+    CoverageSummary getCoverageSummary(int region = ALL_REGIONS) {
+        return getCoverageSummary(findMinimumSatellites(region));
+    }
+
+    // Summary of a findMinimumSatellites() result that is already at hand
+    CoverageSummary getCoverageSummary(const MinimumCover& minimum) const {
+        const auto& [selected, gaps, coveredTime] = minimum;
+
+        CoverageSummary summary;
+        summary.totalDuration = (targetEnd - targetStart) / MINUTES_PER_HOUR;
+        summary.satellitesUsed = selected.size();
+        summary.gaps = gaps;
+        summary.totalCost = 0;
+
+        for (int idx : selected) {
+            summary.totalCost += costs[idx];
+        }
+
+        summary.coveredDuration = coveredTime / MINUTES_PER_HOUR;
+        summary.coveragePercentage =
+            (static_cast<double>(coveredTime) / (targetEnd - targetStart)) * 100.0;
+
+        return summary;
+    }
+};
+
+// ==================== C Entry Points ====================
+// One optimization problem; the arrays hold n satellites each and all times
+// are in minutes.
+struct Job {
+    const int32_t* starts;
+    const int32_t* ends;
+    const double* costs;
+    const int* region_ids;
+    int n;
+    int region;
+    int32_t t0;
+    int32_t t1;
+};
+
+// Filled in place by optimize(). The caller owns sel_idx (room for n ints)
+// and gaps (room for n + 1 start/end pairs). Gaps and durations are in hours.
+struct Result {
+    int nsel;
+    int* sel_idx;
+    int ngaps;
+    double* gaps;
+    double total_dur;
+    double covered_dur;
+    double pct;
+    double total_cost;
+};
+
+extern "C" void optimize(const Job* job, Result* out) {
+    SatelliteCoverageOptimizer optimizer(job->t0, job->t1);
+    optimizer.reserve(job->n);
+    for (int i = 0; i < job->n; i++) {
+        optimizer.addSatellite(job->starts[i], job->ends[i], job->costs[i],
+                               job->region_ids[i]);
+    }
+
+    auto minimum = optimizer.findMinimumSatellites(job->region);
+    const auto& [minSats, minGaps, coveredTime] = minimum;
+
+    out->nsel = static_cast<int>(minSats.size());
+    for (size_t k = 0; k < minSats.size(); k++) {
+        out->sel_idx[k] = minSats[k];
+    }
+
+    out->ngaps = static_cast<int>(minGaps.size());
+    for (size_t k = 0; k < minGaps.size(); k++) {
+        out->gaps[2 * k] = minGaps[k].getStart() / MINUTES_PER_HOUR;
+        out->gaps[2 * k + 1] = minGaps[k].getEnd() / MINUTES_PER_HOUR;
+    }
+
+    CoverageSummary summary = optimizer.getCoverageSummary(minimum);
+    out->total_dur = summary.totalDuration;
+    out->covered_dur = summary.coveredDuration;
+    out->pct = summary.coveragePercentage;
+    out->total_cost = summary.totalCost;
+}
+
+// Jobs are independent, so they are spread over all cores when built with
+// -fopenmp; out[j] receives the result of jobs[j].
+extern "C" void optimize_batch(const Job* jobs, int njobs, Result* out) {
+    #pragma omp parallel for schedule(dynamic)
+    for (int j = 0; j < njobs; j++) {
+        optimize(&jobs[j], &out[j]);
+    }
+}
@@ -0,0 +1,114 @@
+# test_backends.py
+# The greedy cover is written several times: libsatopt, the NumPy sweep, the
+# Numba kernel, the catalog's SQL loop and the subprocess fallback program.
+# These tests run them on the same random payloads and require equal answers.
+import json
+import random
+
+import pytest
+
+import app
+
+REGIONS = ['Asia', 'Europe', 'Global']
+
+needs_library = pytest.mark.skipif(app.optimizer.lib is None, reason='libsatopt could not be built')
+needs_compiler = pytest.mark.skipif(not app.optimizer.have_exe, reason='g++ not found')
+
+
+def random_constellation(rng, n, decimals=1):
+    """Satellites some nested in others, some outside 0-24h.
+
+    Times are rounded to ``decimals`` places of an hour: 1 keeps them on a
+    6-minute grid, 3 puts most of them between whole minutes so the
+    backends' minute rounding is exercised too.
+    """
+    satellites = []
+    for i in range(n):
+        if satellites and rng.random() < 0.3:
+            outer = rng.choice(satellites)
+            start = round(rng.uniform(outer['start'], outer['end']), decimals)
+            end = round(rng.uniform(start, outer['end']), decimals)
+        else:
+            start = round(rng.uniform(-3, 26), decimals)
+            end = round(start + rng.uniform(0, 7), decimals)
+        satellites.append({'name': f'S{i}', 'start': start, 'end': end,
+                           'cost': rng.randint(1, 50), 'region': rng.choice(REGIONS)})
+    return satellites
+
+
+def normalized(result):
+    """The result as a client sees it, after JSON encoding."""
+    assert 'error' not in result, result
+    return json.loads(app.json_response(result).data)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return app.SatelliteCatalog(str(tmp_path / 'catalog.db'))
+
+
+@needs_library
+@pytest.mark.parametrize('decimals', [1, 3])
+@pytest.mark.parametrize('seed', range(40))
+def test_in_process_backends_agree(seed, decimals, catalog):
+    rng = random.Random(seed)
+    satellites = random_constellation(rng, rng.randint(0, 60), decimals)
+    catalog.add_satellites(satellites)
+
+    for region in ['All', rng.choice(REGIONS), 'Nowhere']:
+        expected = normalized(app.optimizer.run_library(satellites, region))
+        assert normalized(app.optimizer.run_numpy(satellites, region)) == expected
+        if app.numba is not None:
+            assert normalized(app.optimizer.run_jit(satellites, region)) == expected
+        assert normalized(catalog.run_optimization(region)) == expected
+
+
+@needs_library
+@needs_compiler
+@pytest.mark.parametrize('decimals', [1, 3])
+@pytest.mark.parametrize('seed', range(10))
+def test_fallback_program_agrees(seed, decimals):
+    rng = random.Random(seed)
+    satellites = random_constellation(rng, rng.randint(0, 30), decimals)
+
+    for region in ['All', rng.choice(REGIONS)]:
+        expected = normalized(app.optimizer.run_library(satellites, region))
+        got = app.optimizer.run_subprocess(satellites, region)
+        assert got['min_satellites']['selected'] == expected['min_satellites']['selected']
+        # The program prints hours with two decimals
+        assert got['min_satellites']['gaps'] == [
+            {key: pytest.approx(value, abs=0.01) for key, value in gap.items()}
+            for gap in expected['min_satellites']['gaps']
+        ]
+        assert got['summary']['total_cost'] == pytest.approx(expected['summary']['total_cost'])
+        assert got['summary']['covered_duration'] == pytest.approx(
+            expected['summary']['covered_duration'], abs=0.01)
+
+
+@needs_library
+def test_nested_satellite_does_not_move_coverage_back():
+    satellites = [
+        {'name': 's3', 'start': 4, 'end': 9, 'cost': 30, 'region': 'Europe'},
+        {'name': 's2', 'start': 5, 'end': 6, 'cost': 30, 'region': 'Europe'},
+        {'name': 's0', 'start': 13, 'end': 17, 'cost': 22, 'region': 'Europe'},
+    ]
+    result = normalized(app.optimizer.run_library(satellites, 'Europe'))
+    assert result['min_satellites'] == {
+        'selected': ['s3', 's0'],
+        'gaps': [{'start': 0.0, 'end': 4.0}, {'start': 9.0, 'end': 13.0},
+                 {'start': 17.0, 'end': 24.0}],
+    }
+    assert result['summary']['total_cost'] == 52
+    assert result['summary']['covered_duration'] == 9.0
+
+
+@needs_library
+@needs_compiler
+def test_fallback_rounds_to_minutes():
+    # 5.004 h and 5.006 h are both 300 minutes, so there is no gap
+    satellites = [
+        {'name': 'A', 'start': 0, 'end': 5.004, 'cost': 1, 'region': 'Europe'},
+        {'name': 'B', 'start': 5.006, 'end': 24, 'cost': 1, 'region': 'Europe'},
+    ]
+    for result in (app.optimizer.run_library(satellites), app.optimizer.run_subprocess(satellites)):
+        assert result['min_satellites'] == {'selected': ['A', 'B'], 'gaps': []}
@@ -0,0 +1,5 @@
+# wsgi.py
+# WSGI entry point; see gunicorn.conf.py for the production server settings.
+from app import app
+
+application = app
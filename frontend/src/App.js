@@ -2,6 +2,24 @@
 import React, { useState, useEffect } from 'react';
 import './App.css';
 
+// The API returns all_satellites column-wise ({ name: [...], start: [...], ... });
+// the views below work with one object per satellite.
+const withSatelliteRows = (result) => {
+  const columns = result.all_satellites;
+  if (!columns) return result;
+  return {
+    ...result,
+    all_satellites: columns.name.map((name, i) => ({
+      name,
+      start: columns.start[i],
+      end: columns.end[i],
+      duration: columns.duration[i],
+      cost: columns.cost[i],
+      region: columns.region[i]
+    }))
+  };
+};
+
 const App = () => {
   const [satellites, setSatellites] = useState([]);
   const [optimizationResult, setOptimizationResult] = useState(null);
@@ -43,7 +61,7 @@ const App = () => {
       });
 
       const result = await response.json();
-      setOptimizationResult(result);
+      setOptimizationResult(withSatelliteRows(result));
     } catch (error) {
       console.error('Optimization error:', error);
       alert('Error running optimization. Make sure the backend is running.');
@@ -56,7 +74,7 @@ const App = () => {
     try {
       const response = await fetch('http://localhost:5000/api/default-optimization');
       const result = await response.json();
-      setOptimizationResult(result);
+      setOptimizationResult(withSatelliteRows(result));
     } catch (error) {
       console.error('Default optimization error:', error);
     }
@@ -6,6 +6,8 @@
 #include <memory>
 #include <limits>
 #include <cmath>
+#include <cstdint>
+#include <unordered_map>
 
 // ==================== CoverageInterval Class ====================
 class CoverageInterval {
@@ -29,27 +31,17 @@ public:
     }
 };
 
-// ==================== Satellite Class ====================
-class Satellite {
-private:
-    std::string name;
-    CoverageInterval interval;
-    double cost;
-    std::string region;
+// ==================== Satellite Record ====================
+// Plain 20-byte record; the name and region strings live in the optimizer's
+// side tables so the algorithms only ever touch numeric fields.
+struct Satellite {
+    int32_t nameId;
+    int32_t regionId;
+    float start;
+    float end;
+    float cost;
 
-public:
-    Satellite(const std::string& n, const CoverageInterval& i, 
-              double c = 1.0, const std::string& r = "Global")
-        : name(n), interval(i), cost(c), region(r) {}
-    
-    std::string getName() const { return name; }
-    CoverageInterval getInterval() const { return interval; }
-    double getCost() const { return cost; }
-    std::string getRegion() const { return region; }
-    
-    bool operator<(const Satellite& other) const {
-        return interval.getStart() < other.interval.getStart();
-    }
+    CoverageInterval getInterval() const { return CoverageInterval(start, end); }
 };
 
 // ==================== Coverage Summary Structure ====================
@@ -66,20 +58,33 @@ struct CoverageSummary {
 class SatelliteCoverageOptimizer {
 private:
     std::vector<Satellite> satellites;
+    std::vector<std::string> nameTable;
+    std::vector<std::string> regionTable;
+    std::unordered_map<std::string, int32_t> regionIndex;
     double targetStart;
     double targetEnd;
 
-    std::vector<Satellite> filterByRegion(const std::string& region) const {
+    // Indices of the satellites in a region, sorted by start time
+    std::vector<int32_t> filterByRegion(const std::string& region) const {
+        std::vector<int32_t> filtered;
         if (region == "All") {
-            return satellites;
-        }
-        
-        std::vector<Satellite> filtered;
-        for (const auto& sat : satellites) {
-            if (sat.getRegion() == region) {
-                filtered.push_back(sat);
+            for (size_t i = 0; i < satellites.size(); i++) {
+                filtered.push_back(static_cast<int32_t>(i));
+            }
+        } else {
+            auto it = regionIndex.find(region);
+            if (it != regionIndex.end()) {
+                for (size_t i = 0; i < satellites.size(); i++) {
+                    if (satellites[i].regionId == it->second) {
+                        filtered.push_back(static_cast<int32_t>(i));
+                    }
+                }
             }
         }
+
+        std::stable_sort(filtered.begin(), filtered.end(), [this](int32_t a, int32_t b) {
+            return satellites[a].start < satellites[b].start;
+        });
         return filtered;
     }
 
@@ -89,59 +94,66 @@ public:
     
     void addSatellite(const std::string& name, double start, double end,
                      double cost = 1.0, const std::string& region = "Global") {
-        CoverageInterval interval(start, end);
-        satellites.emplace_back(name, interval, cost, region);
+        auto [it, inserted] = regionIndex.emplace(
+            region, static_cast<int32_t>(regionTable.size()));
+        if (inserted) {
+            regionTable.push_back(region);
+        }
+
+        nameTable.push_back(name);
+        satellites.push_back({static_cast<int32_t>(nameTable.size() - 1), it->second,
+                              static_cast<float>(start), static_cast<float>(end),
+                              static_cast<float>(cost)});
     }
+
+    const Satellite& getSatellite(int32_t idx) const { return satellites[idx]; }
+    const std::string& getName(int32_t idx) const { return nameTable[satellites[idx].nameId]; }
+    const std::string& getRegion(int32_t idx) const { return regionTable[satellites[idx].regionId]; }
     
     // Greedy Algorithm: Minimum Number of Satellites
-    std::pair<std::vector<Satellite>, std::vector<CoverageInterval>>
+    std::pair<std::vector<int32_t>, std::vector<CoverageInterval>>
     findMinimumSatellites(const std::string& region = "All") {
-        std::vector<Satellite> filtered = filterByRegion(region);
-        std::sort(filtered.begin(), filtered.end());
+        std::vector<int32_t> filtered = filterByRegion(region);
         
-        std::vector<Satellite> selected;
+        std::vector<int32_t> selected;
         std::vector<CoverageInterval> gaps;
         double currentEnd = targetStart;
         size_t i = 0;
         
         while (currentEnd < targetEnd && i < filtered.size()) {
-            std::vector<Satellite> candidates;
-            
-            // Collect all satellites that can cover current position
+            // Scan the satellites that can cover the current position, keeping
+            // the one that reaches furthest
+            double bestEnd = currentEnd;
+            int32_t bestIdx = -1;
             while (i < filtered.size() && 
-                   filtered[i].getInterval().getStart() <= currentEnd) {
-                candidates.push_back(filtered[i]);
+                   satellites[filtered[i]].start <= currentEnd) {
+                if (satellites[filtered[i]].end > bestEnd) {
+                    bestEnd = satellites[filtered[i]].end;
+                    bestIdx = filtered[i];
+                }
                 i++;
             }
             
-            if (candidates.empty()) {
+            if (bestIdx < 0) {
+                // Nothing left to extend with; the trailing gap is added below
+                if (i >= filtered.size()) {
+                    break;
+                }
+                
                 // Gap detected
                 double gapStart = currentEnd;
-                double gapEnd = (i < filtered.size()) ? 
-                    std::min(filtered[i].getInterval().getStart(), targetEnd) : targetEnd;
+                double gapEnd = std::min(targetEnd, static_cast<double>(satellites[filtered[i]].start));
                 
                 if (gapStart < gapEnd) {
                     gaps.emplace_back(gapStart, gapEnd);
                 }
                 
-                if (i < filtered.size()) {
-                    currentEnd = filtered[i].getInterval().getEnd();
-                    selected.push_back(filtered[i]);
-                    i++;
-                } else {
-                    break;
-                }
+                currentEnd = satellites[filtered[i]].end;
+                selected.push_back(filtered[i]);
+                i++;
             } else {
-                // Select satellite with maximum end time
-                auto bestCandidate = std::max_element(
-                    candidates.begin(), candidates.end(),
-                    [](const Satellite& a, const Satellite& b) {
-                        return a.getInterval().getEnd() < b.getInterval().getEnd();
-                    }
-                );
-                
-                selected.push_back(*bestCandidate);
-                currentEnd = bestCandidate->getInterval().getEnd();
+                selected.push_back(bestIdx);
+                currentEnd = bestEnd;
             }
         }
         
@@ -153,10 +165,9 @@ public:
     }
     
     // Dynamic Programming: Minimum Cost Coverage
-    std::tuple<std::vector<Satellite>, double, std::vector<CoverageInterval>>
+    std::tuple<std::vector<int32_t>, double, std::vector<CoverageInterval>>
     findMinimumCostCoverage(const std::string& region = "All") {
-        std::vector<Satellite> filtered = filterByRegion(region);
-        std::sort(filtered.begin(), filtered.end());
+        std::vector<int32_t> filtered = filterByRegion(region);
         
         int n = filtered.size();
         std::vector<double> dp(n + 1, std::numeric_limits<double>::infinity());
@@ -167,12 +178,12 @@ public:
             if (dp[i] == std::numeric_limits<double>::infinity()) continue;
             
             double currentEnd = (i == 0) ? targetStart : 
-                filtered[parent[i]].getInterval().getEnd();
+                satellites[filtered[parent[i]]].end;
             
             for (int j = i; j < n; j++) {
-                if (filtered[j].getInterval().getStart() > currentEnd) break;
+                if (satellites[filtered[j]].start > currentEnd) break;
                 
-                double newCost = dp[i] + filtered[j].getCost();
+                double newCost = dp[i] + satellites[filtered[j]].cost;
                 if (newCost < dp[j + 1]) {
                     dp[j + 1] = newCost;
                     parent[j + 1] = j;
@@ -181,13 +192,13 @@ public:
         }
         
         // Reconstruct solution
-        std::vector<Satellite> selected;
+        std::vector<int32_t> selected;
         double totalCost = 0;
         int idx = n;
         
         while (idx > 0 && parent[idx] != -1) {
             selected.push_back(filtered[parent[idx]]);
-            totalCost += filtered[parent[idx]].getCost();
+            totalCost += satellites[filtered[parent[idx]]].cost;
             idx = parent[idx];
         }
         
@@ -197,11 +208,11 @@ public:
         std::vector<CoverageInterval> gaps;
         double currentEnd = targetStart;
         
-        for (const auto& sat : selected) {
-            if (sat.getInterval().getStart() > currentEnd) {
-                gaps.emplace_back(currentEnd, sat.getInterval().getStart());
+        for (int32_t sat : selected) {
+            if (satellites[sat].start > currentEnd) {
+                gaps.emplace_back(currentEnd, satellites[sat].start);
             }
-            currentEnd = std::max(currentEnd, sat.getInterval().getEnd());
+            currentEnd = std::max(currentEnd, static_cast<double>(satellites[sat].end));
         }
         
         if (currentEnd < targetEnd) {
@@ -221,12 +232,23 @@ public:
         summary.gaps = gaps;
         summary.totalCost = 0;
         
+        // Merge the clamped intervals so overlapping satellites count once
+        std::vector<std::pair<double, double>> spans;
+        for (int32_t sat : selected) {
+            summary.totalCost += satellites[sat].cost;
+            spans.emplace_back(std::max(targetStart, static_cast<double>(satellites[sat].start)),
+                               std::min(targetEnd, static_cast<double>(satellites[sat].end)));
+        }
+        std::sort(spans.begin(), spans.end());
+        
         double coveredTime = 0;
-        for (const auto& sat : selected) {
-            summary.totalCost += sat.getCost();
-            double start = std::max(targetStart, sat.getInterval().getStart());
-            double end = std::min(targetEnd, sat.getInterval().getEnd());
-            coveredTime += (end - start);
+        double reached = targetStart;
+        for (const auto& [start, end] : spans) {
+            // Spans entirely outside the target window clamp to start >= end
+            if (start < end && end > reached) {
+                coveredTime += end - std::max(start, reached);
+                reached = end;
+            }
         }
         
         summary.coveredDuration = coveredTime;
@@ -247,13 +269,13 @@ public:
         std::cout << std::string(80, '-') << std::endl;
         
         for (const auto& sat : satellites) {
-            std::cout << std::left << std::setw(12) << sat.getName()
+            std::cout << std::left << std::setw(12) << nameTable[sat.nameId]
                       << std::setw(10) << std::fixed << std::setprecision(1) 
-                      << sat.getInterval().getStart()
-                      << std::setw(10) << sat.getInterval().getEnd()
+                      << sat.start
+                      << std::setw(10) << sat.end
                       << std::setw(12) << sat.getInterval().getDuration()
-                      << std::setw(10) << std::setprecision(2) << sat.getCost()
-                      << std::setw(15) << sat.getRegion() << std::endl;
+                      << std::setw(10) << std::setprecision(2) << sat.cost
+                      << std::setw(15) << regionTable[sat.regionId] << std::endl;
         }
         std::cout << std::string(80, '-') << std::endl;
     }
@@ -262,7 +284,8 @@ public:
 // ==================== Visualization Helper Class ====================
 class CoverageVisualizer {
 public:
-    static void printSatelliteList(const std::vector<Satellite>& satellites) {
+    static void printSatelliteList(const SatelliteCoverageOptimizer& optimizer,
+                                   const std::vector<int32_t>& selected) {
         std::cout << "\nSelected Satellites:" << std::endl;
         std::cout << std::string(70, '-') << std::endl;
         std::cout << std::left << std::setw(12) << "Name" 
@@ -273,14 +296,15 @@ public:
                   << std::setw(15) << "Region" << std::endl;
         std::cout << std::string(70, '-') << std::endl;
         
-        for (const auto& sat : satellites) {
-            std::cout << std::left << std::setw(12) << sat.getName()
+        for (int32_t idx : selected) {
+            const Satellite& sat = optimizer.getSatellite(idx);
+            std::cout << std::left << std::setw(12) << optimizer.getName(idx)
                       << std::setw(10) << std::fixed << std::setprecision(1) 
-                      << sat.getInterval().getStart()
-                      << std::setw(10) << sat.getInterval().getEnd()
+                      << sat.start
+                      << std::setw(10) << sat.end
                       << std::setw(12) << sat.getInterval().getDuration()
-                      << std::setw(10) << std::setprecision(2) << sat.getCost()
-                      << std::setw(15) << sat.getRegion() << std::endl;
+                      << std::setw(10) << std::setprecision(2) << sat.cost
+                      << std::setw(15) << optimizer.getRegion(idx) << std::endl;
         }
         std::cout << std::string(70, '-') << std::endl;
     }
@@ -344,7 +368,7 @@ int main() {
     std::cout << "╚════════════════════════════════════════════════════════════════╝" << std::endl;
     
     auto [minSats, minGaps] = optimizer.findMinimumSatellites("All");
-    CoverageVisualizer::printSatelliteList(minSats);
+    CoverageVisualizer::printSatelliteList(optimizer, minSats);
     CoverageVisualizer::printCoverageGaps(minGaps);
     
     // Algorithm 2: Minimum Cost Coverage (Dynamic Programming)
@@ -353,7 +377,7 @@ int main() {
     std::cout << "╚════════════════════════════════════════════════════════════════╝" << std::endl;
     
     auto [costSats, totalCost, costGaps] = optimizer.findMinimumCostCoverage("All");
-    CoverageVisualizer::printSatelliteList(costSats);
+    CoverageVisualizer::printSatelliteList(optimizer, costSats);
     std::cout << "\n→ Total Cost: $" << std::fixed << std::setprecision(2) 
               << totalCost << std::endl;
     CoverageVisualizer::printCoverageGaps(costGaps);